@@ -5,19 +5,26 @@ from __future__ import annotations
 
 import re
 import sys
-from dataclasses import dataclass
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from typing import Iterable, List, Sequence
 
 ALLOWED_TYPES = frozenset(
     {"feat", "fix", "refactor", "fmt", "test", "docs", "build", "chore"}
 )
 AUTO_BYPASS_PREFIXES = ("Merge ", "Revert ", "fixup! ", "squash! ")
-HEADER_RE = re.compile(r"^([a-z]+)(\(([^)]+)\))?(!)?:\s*(.+)$")
-FOOTER_RE = re.compile(r"^(BREAKING CHANGE|[A-Za-z-]+):\s")
-DIFF_RE = re.compile(r"^(diff --git |\+\+\+ |--- |@@ )", re.MULTILINE)
-IGNORE_MARKER_RE = re.compile(r"\s*-+\s+IGNORE\s*-+", re.MULTILINE)
-INVALID_SUBJECT_CHARS_RE = re.compile(r"^[a-z0-9 \-_/():,#+]*$")
+HEADER_RE = re.compile(r"([a-z]+)(\(([^)]+)\))?(!)?:\s*(.+)", re.ASCII)
+FORBIDDEN_RE = re.compile(
+    r"(?P<ignore>\s*-+\s+IGNORE\s*-+)|(?P<diff>^(?:diff --git |\+\+\+ |--- |@@ ))",
+    re.MULTILINE | re.ASCII,
+)
+_HEADER_FULLMATCH = HEADER_RE.fullmatch
+_FORBIDDEN_SEARCH = FORBIDDEN_RE.search
+_ALLOWED_SUBJECT_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789 -_/():,#+")
+# Maps allowed subject bytes to themselves and everything else to NUL;
+# a NUL in the translated subject therefore flags an invalid character.
+_SUBJECT_TBL = bytes(
+    byte if chr(byte) in _ALLOWED_SUBJECT_CHARS else 0 for byte in range(256)
+)
 
 
 class ValidationError(Exception):
@@ -28,73 +35,57 @@ class ValidationError(Exception):
         self.reasons = tuple(reasons)
 
 
-@dataclass(frozen=True)
-class ParsedMessage:
-    lines: List[str]
-    header: str
-    header_idx: int
-    footers: List[str]
-    first_footer_idx: int
+_HELP_TAIL = (
+    "\n"
+    "Expected header: <type>(<scope>)!: <subject>\n"
+    "Where:\n"
+    "  - type one of: feat|fix|refactor|fmt|test|docs|build|chore\n"
+    "  - scope (optional) matches ^[A-Za-z0-9/-]+$\n"
+    "  - ! (optional) indicates breaking change and "
+    "REQUIRES a 'BREAKING CHANGE:' footer\n"
+    "  - subject: 1-50 chars, lowercase start, allowed: "
+    "[a-z0-9 \\ -_/():,#+], no trailing .\n"
+    "\n"
+    "Body (optional): lines wrapped to <= 72 chars.\n"
+    "Footers (optional): one trailer per line, e.g. 'BREAKING CHANGE: ...'\n"
+    "\n"
+    "Examples:\n"
+    "  feat(cli): add terse output flag\n"
+    "  fix: handle empty input without panic"
+)
 
 
 def _error_summary(reasons: Sequence[str]) -> str:
-    parts = ["commit message validation failed:"]
-    parts.extend(f"  - {reason}" for reason in reasons)
-    parts.extend(
-        (
-            "",
-            "Expected header: <type>(<scope>)!: <subject>",
-            "Where:",
-            "  - type one of: feat|fix|refactor|fmt|test|docs|build|chore",
-            "  - scope (optional) matches ^[A-Za-z0-9/-]+$",
-            (
-                "  - ! (optional) indicates breaking change and "
-                "REQUIRES a 'BREAKING CHANGE:' footer"
-            ),
-            (
-                "  - subject: 1-50 chars, lowercase start, allowed: "
-                "[a-z0-9 \\ -_/():,#+], no trailing ."
-            ),
-            "",
-            "Body (optional): lines wrapped to <= 72 chars.",
-            "Footers (optional): one trailer per line, e.g. 'BREAKING CHANGE: ...'",
-            "",
-            "Examples:",
-            "  feat(cli): add terse output flag",
-            "  fix: handle empty input without panic",
-        )
-    )
-    return "\n".join(parts)
+    listed = "\n".join(f"  - {reason}" for reason in reasons)
+    return f"commit message validation failed:\n{listed}\n{_HELP_TAIL}"
 
 
 def _raise_invalid(*reasons: str) -> None:
     raise ValidationError(list(reasons))
 
 
-def normalize_message(msg_path: Path) -> List[str]:
-    """Normalize CRLF, drop template lines, and rewrite the message file."""
+def _is_template_line(line: str) -> bool:
+    """Return True for comment/template lines that git adds to the message."""
 
-    raw = msg_path.read_text(encoding="utf-8", errors="replace")
-    normalized = raw.replace("\r\n", "\n").replace("\r", "\n")
+    return line.lstrip(" \t").startswith("#") or line.startswith(("$", "[$"))
 
-    lines: list[str] = []
-    for line in normalized.split("\n"):
-        if re.match(r"^[\s]*#", line):
-            continue
-        if re.match(r"^\$", line):
-            continue
-        if re.match(r"^\[\$", line):
-            continue
-        lines.append(line)
 
-    sanitized = "\n".join(lines)
-    if not sanitized.endswith("\n"):
-        sanitized = f"{sanitized}\n"
-    msg_path.write_text(sanitized, encoding="utf-8")
-    return lines
+def _read_normalized(msg_path: Path) -> tuple[list[str], str, bool]:
+    """Read the message, normalize CRLF, and drop template lines.
+
+    Pure read: the file on disk is left untouched. The final bool is
+    True when the sanitized text differs from what is on disk.
+    """
+
+    raw = msg_path.read_bytes().decode("utf-8", errors="replace")
 
+    lines = [line for line in raw.splitlines() if not _is_template_line(line)]
 
-def find_header(lines: List[str]) -> tuple[str, int]:
+    sanitized = "\n".join(lines) + "\n"
+    return lines, sanitized, sanitized != raw
+
+
+def find_header(lines: list[str]) -> tuple[str, int]:
     """Return (header, index) or raise if missing."""
 
     for idx, line in enumerate(lines):
@@ -104,24 +95,52 @@ def find_header(lines: List[str]) -> tuple[str, int]:
     raise AssertionError("unreachable")
 
 
-def collect_footers(lines: List[str], start_idx: int) -> tuple[List[str], int]:
-    """Collect footer lines and return (footers, first_footer_idx)."""
+def _is_footer(line: str) -> bool:
+    """Return True for trailer lines like 'BREAKING CHANGE: ...' or 'Key-Name: ...'."""
+
+    colon = line.find(":")
+    if colon <= 0 or colon + 1 >= len(line) or not line[colon + 1].isspace():
+        return False
+    key = line[:colon]
+    return key == "BREAKING CHANGE" or all(
+        (char.isascii() and char.isalpha()) or char == "-" for char in key
+    )
+
+
+def _classify(lines: list[str], header_idx: int) -> tuple[list[str], bool]:
+    """Length-check the body and spot the BREAKING CHANGE footer in one pass.
+
+    Footers are the trailing run of trailer-like lines after the body;
+    everything else after the header is body. Returns
+    (body_errors, has_breaking).
+    """
+
+    pending: list[int] = []
+    body_errors: list[str] = []
+    has_breaking = False
 
-    first_footer_idx = len(lines)
-    for i in range(len(lines) - 1, -1, -1):
+    for i in range(header_idx + 1, len(lines)):
         line = lines[i]
         if not line.strip():
             continue
-        if FOOTER_RE.match(line):
-            first_footer_idx = i
+        if _is_footer(line):
+            pending.append(i)
+            if line.startswith("BREAKING CHANGE: "):
+                has_breaking = True
             continue
-        break
-    footers = [line for line in lines[first_footer_idx:] if line.strip()]
-    return footers, first_footer_idx
+        # A non-footer line demotes any pending trailer-like lines to body.
+        pending.append(i)
+        for j in pending:
+            if len(lines[j]) > 72:
+                body_errors.append(f"body line {j + 1} exceeds 72 chars")
+        pending.clear()
+        has_breaking = False
+
+    return body_errors, has_breaking
 
 
 def validate_header(header: str) -> tuple[str, str, str, str]:
-    match = HEADER_RE.match(header)
+    match = _HEADER_FULLMATCH(header)
     if not match:
         _raise_invalid("header must match '<type>(<scope>)!: <subject>'")
 
@@ -135,7 +154,9 @@ def validate_header(header: str) -> tuple[str, str, str, str]:
     if type_ not in ALLOWED_TYPES:
         _raise_invalid(f"invalid type '{type_}'")
 
-    if scope and not re.fullmatch(r"[A-Za-z0-9/-]+", scope):
+    if scope and not all(
+        (char.isascii() and char.isalnum()) or char in "/-" for char in scope
+    ):
         _raise_invalid(f"scope '{scope}' must match ^[A-Za-z0-9/-]+$")
 
     subject_len = len(subject)
@@ -145,82 +166,66 @@ def validate_header(header: str) -> tuple[str, str, str, str]:
         _raise_invalid("subject must not end with a period")
     if not subject or not subject[0].islower():
         _raise_invalid("subject must start with a lowercase letter")
-    if not INVALID_SUBJECT_CHARS_RE.fullmatch(subject):
+    if 0 in subject.encode("latin-1", "replace").translate(_SUBJECT_TBL):
         _raise_invalid(
             "subject contains invalid characters; allowed: [a-z0-9 -_/():,#+]"
         )
-    if "!" in subject:
-        _raise_invalid("subject contains invalid characters; '!' is not allowed")
 
     return type_, scope, bang, subject
 
 
-def validate_body(lines: List[str], header_idx: int, first_footer_idx: int) -> None:
-    for i in range(header_idx + 1, first_footer_idx):
-        line = lines[i]
-        if not line.strip():
-            continue
-        if len(line) > 72:
-            _raise_invalid(f"body line {i + 1} exceeds 72 chars")
-
-
 def ensure_no_diff_or_ignore_markers(text: str) -> None:
-    if IGNORE_MARKER_RE.search(text):
-        _raise_invalid("commit message contains forbidden internal markers")
-    if DIFF_RE.search(text):
-        _raise_invalid(
-            "commit message appears to contain a raw diff; remove patch content"
-        )
-
-
-def ensure_breaking_footer_if_needed(bang: str, footers: List[str]) -> None:
-    if not bang:
-        return
-    if any(footer.startswith("BREAKING CHANGE: ") for footer in footers):
+    match = _FORBIDDEN_SEARCH(text)
+    if not match:
         return
-    _raise_invalid(
-        "'!' in header requires a 'BREAKING CHANGE:' footer explaining the change"
-    )
+    # An IGNORE marker anywhere outranks a diff line, wherever each appears.
+    if match.lastgroup == "ignore" or any(
+        m.lastgroup == "ignore" for m in FORBIDDEN_RE.finditer(text, match.end())
+    ):
+        _raise_invalid("commit message contains forbidden internal markers")
+    _raise_invalid("commit message appears to contain a raw diff; remove patch content")
 
 
-def parse_message(msg_path: Path) -> ParsedMessage:
-    lines = normalize_message(msg_path)
-    header, header_idx = find_header(lines)
-    footers, first_footer_idx = collect_footers(lines, header_idx)
-    return ParsedMessage(lines, header, header_idx, footers, first_footer_idx)
+def ensure_breaking_footer_if_needed(bang: str, has_breaking: bool) -> None:
+    if bang and not has_breaking:
+        _raise_invalid(
+            "'!' in header requires a 'BREAKING CHANGE:' footer explaining the change"
+        )
 
 
 def validate_commit_message(msg_path: Path) -> None:
-    parsed = parse_message(msg_path)
+    lines, text, dirty = _read_normalized(msg_path)
+    header, header_idx = find_header(lines)
 
-    if parsed.header.startswith(AUTO_BYPASS_PREFIXES):
+    if header.startswith(AUTO_BYPASS_PREFIXES):
         return
 
-    ensure_no_diff_or_ignore_markers("\n".join(parsed.lines))
-    _, _, bang, _ = validate_header(parsed.header)
-    ensure_breaking_footer_if_needed(bang, parsed.footers)
-    validate_body(parsed.lines, parsed.header_idx, parsed.first_footer_idx)
+    if dirty:
+        msg_path.write_bytes(text.encode("utf-8"))
+    body_errors, has_breaking = _classify(lines, header_idx)
+
+    ensure_no_diff_or_ignore_markers(text)
+    _, _, bang, _ = validate_header(header)
+    ensure_breaking_footer_if_needed(bang, has_breaking)
+    if body_errors:
+        _raise_invalid(body_errors[0])
 
 
 def main(argv: Iterable[str]) -> None:
-    args = list(argv)
-    if not args:
-        print(
-            "commit-msg: message file not provided or does not exist", file=sys.stderr
-        )
+    first = next(iter(argv), None)
+    if first is None:
+        sys.stderr.write("commit-msg: message file not provided or does not exist\n")
         sys.exit(1)
 
-    msg_path = Path(args[0])
+    msg_path = Path(first)
     if not msg_path.exists():
-        print(
-            "commit-msg: message file not provided or does not exist", file=sys.stderr
-        )
+        sys.stderr.write("commit-msg: message file not provided or does not exist\n")
         sys.exit(1)
 
     try:
         validate_commit_message(msg_path)
     except ValidationError as err:
-        print(_error_summary(err.reasons), file=sys.stderr)
+        sys.stderr.write(f"{_error_summary(err.reasons)}\n")
         sys.exit(1)
 
 
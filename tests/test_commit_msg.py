@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
 import textwrap
 from pathlib import Path
@@ -112,3 +113,27 @@ def test_rejects_ignore_marker(tmp_path: Path) -> None:
 def test_merge_messages_bypass_validation(tmp_path: Path) -> None:
     path = write_message(tmp_path, "Merge branch 'main'")
     validate_commit_message(path)
+
+
+def test_clean_message_not_rewritten(tmp_path: Path) -> None:
+    path = write_message(tmp_path, "feat: add terse output")
+    os.utime(path, ns=(0, 0))
+    validate_commit_message(path)
+    assert path.stat().st_mtime_ns == 0
+
+
+def test_bypassed_message_not_rewritten(tmp_path: Path) -> None:
+    path = write_message(
+        tmp_path,
+        """
+        Merge branch 'main'
+
+        # Conflicts:
+        #	some/file.py
+        """,
+    )
+    before = path.read_bytes()
+    os.utime(path, ns=(0, 0))
+    validate_commit_message(path)
+    assert path.stat().st_mtime_ns == 0
+    assert path.read_bytes() == before